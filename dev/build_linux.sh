@@ -9,7 +9,12 @@ log "Building Vidify for Linux"
 # for different fixes and workarounds.
 log "Copying module"
 rm -rf vidify
-cp -r  ../vidify .
+# --reflink=auto lets the kernel share the data blocks on filesystems
+# that support it (Btrfs, XFS...), instead of copying them in userspace.
+cp -r --reflink=auto ../vidify .
+# The bytecode caches from the development environment are useless in the
+# copy (PyInstaller regenerates them), and may be stale.
+find vidify -name __pycache__ -type d -prune -exec rm -rf {} +
 
 log "Applying pre-build patches"
 
@@ -41,25 +46,44 @@ echo -e \
 
 log "Running PyInstaller"
 
-pyinstaller linux.spec --noconfirm || exit 1
+# Bundling optimized bytecode (no asserts nor __debug__ blocks), which is
+# smaller and slightly faster to load on startup.
+PYTHONOPTIMIZE=1 pyinstaller linux.spec --noconfirm || exit 1
 
 
 log "Applying post-build patches"
 
+# Required file not installed by default with Tekore. The download is
+# independent from the library copies below, so it runs in the background
+# and is awaited right before compressing everything.
+mkdir -p dist/vidify/tekore
+wget -q "https://raw.githubusercontent.com/felix-hilden/tekore/master/tekore/VERSION" -O "dist/vidify/tekore/VERSION" &
+
 # Libraries imported into the files
 for library in "${LIBRARIES[@]}"; do
-    dir=$(find / -name libmpv.so -print -quit)
+    # The dynamic linker cache already knows where the system libraries
+    # are, so asking ldconfig is much faster than scanning the whole
+    # filesystem. The standard library directories are only walked as a
+    # fallback, in case the library isn't in the cache.
+    dir=$(ldconfig -p | awk -v lib="$library" '$1 == lib { print $NF; exit }')
+    if [ -z "$dir" ]; then
+        for libdir in /usr/lib /usr/local/lib /usr/lib64 /lib; do
+            dir=$(find "$libdir" -name "$library" -print -quit 2>/dev/null)
+            if [ -n "$dir" ]; then
+                break
+            fi
+        done
+    fi
     if [ -z "$dir" ]; then
         log "Library $library not found"
         exit 1
     fi
     log "Found $library at $dir"
-    cp "$dir" dist/vidify
+    cp --reflink=auto "$dir" dist/vidify
 done
 
-# Required file not installed by default with Tekore.
-mkdir -p dist/vidify/tekore
-wget -q "https://raw.githubusercontent.com/felix-hilden/tekore/master/tekore/VERSION" -O "dist/vidify/tekore/VERSION"
+# Waiting for the Tekore download started above.
+wait
 
 # Saving everything into a zip inside dist/
 version=$(awk '{print $3}' vidify/version.py | tr -d '"')
@@ -8,6 +8,9 @@ if ( Test-Path -Path vidify ) {
 	rm -r vidify
 }
 cp -r ../vidify .
+# The bytecode caches from the development environment are useless in the
+# copy (PyInstaller regenerates them), and may be stale.
+Get-ChildItem vidify -Recurse -Directory -Filter __pycache__ | Remove-Item -Recurse -Force
 
 $version = ((Get-Content vidify/version.py) -split '"' | Select -Index 1)
 
@@ -27,6 +30,9 @@ def is_installed(*args):
 
 
 echo ">> Running PyInstaller..."
+# Bundling optimized bytecode (no asserts nor __debug__ blocks), which is
+# smaller and slightly faster to load on startup.
+$env:PYTHONOPTIMIZE = "1"
 pyinstaller windows.spec --noconfirm
 
 
@@ -1,3 +1,5 @@
+import re
+
 from setuptools import setup, find_packages
 from pkg_resources import DistributionNotFound, get_distribution
 from sys import platform
@@ -11,9 +13,10 @@ def is_installed(pkgname: str) -> bool:
         return False
 
 
-# Get version inside vidify/version.py without importing the package
-exec(compile(open('vidify/version.py').read(),
-             'vidify/version.py', 'exec'))
+# Get version inside vidify/version.py without importing or executing
+# the package.
+with open('vidify/version.py') as f:
+    __version__ = re.search(r'__version__\s*=\s*"([^"]+)"', f.read()).group(1)
 
 install_deps = [
     # Base package
@@ -0,0 +1,17 @@
+"""
+Creates the Qt application used by the GUI-dependent tests once for the
+whole session. Importing this module is idempotent, so every test
+package that needs Qt can simply `import tests._qt`.
+
+QtWebEngineWidgets has to be imported before the QApplication is
+constructed, so it's also done here. The pure test modules (like
+test_utils.py or test_config.py) don't import this, so they stay
+runnable without the WebEngine system libraries.
+"""
+
+import qtpy.QtWebEngineWidgets  # noqa: F401
+from qtpy.QtWidgets import QApplication
+
+
+if QApplication.instance() is None:
+    _ = QApplication(["vidify"])
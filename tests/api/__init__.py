@@ -0,0 +1 @@
+import tests._qt  # noqa: F401
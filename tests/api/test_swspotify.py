@@ -1,14 +1,9 @@
 import os
 import unittest
 
-import qtpy.QtWebEngineWidgets  # noqa: F401
-from qtpy.QtWidgets import QApplication
-
 from vidify import Platform, CURRENT_PLATFORM
 
 
-if QApplication.instance() is None:
-    _ = QApplication(["vidify"])
 CI = "CI" in os.environ and os.environ["CI"] == "true"
 SKIP_MSG = "Skipping this test as it won't work on the current system."
 
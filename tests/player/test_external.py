@@ -1,14 +1,9 @@
 import time
 import unittest
 
-import qtpy.QtWebEngineWidgets  # noqa: F401
-from qtpy.QtWidgets import QApplication
-
 from vidify.player.external import ExternalPlayer
 
 
-if QApplication.instance() is None:
-    _ = QApplication(["vidify"])
 p: ExternalPlayer = None
 POS_MARGIN = 10  # In milliseconds
 
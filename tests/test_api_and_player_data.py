@@ -6,17 +6,13 @@ throughout the entire module.
 
 import unittest
 
-import qtpy.QtWebEngineWidgets  # noqa: F401
-from qtpy.QtWidgets import QApplication
-
+import tests._qt  # noqa: F401
 from vidify.gui.window import MainWindow
 from vidify.api import APIS
 from vidify.player import PLAYERS, initialize_player
 from vidify.config import Config, OPTIONS
 
 
-if QApplication.instance() is None:
-    _ = QApplication(["vidify"])
 config = Config()
 config.parse()
 win = MainWindow(config)
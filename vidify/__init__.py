@@ -4,8 +4,10 @@ logger, cross-platform variables...
 """
 
 import sys
+import importlib
 from enum import Enum
 from typing import Optional, Tuple
+from functools import lru_cache
 from dataclasses import dataclass
 from pkg_resources import DistributionNotFound, get_distribution
 
@@ -84,6 +86,21 @@ class BaseModuleData:
     module: str
     class_name: str
 
+    def get_class(self) -> type:
+        """
+        Returns the class described by `module` and `class_name`. The
+        import is only done the first time, so later calls (reconnections,
+        for instance) are just a cache lookup.
+        """
+
+        return _import_class(self.module, self.class_name)
+
+
+@lru_cache(maxsize=None)
+def _import_class(module: str, class_name: str) -> type:
+    mod = importlib.import_module(module)
+    return getattr(mod, class_name)
+
 
 def find_module(data: Tuple[BaseModuleData], module_id: str) -> BaseModuleData:
     for element in data:
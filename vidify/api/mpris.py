@@ -196,8 +196,9 @@ class MPRISAPI(APIBase):
         """
 
         # The time when this function started is saved for the audiosync
-        # feature.
-        start_time = time.time()
+        # feature. It's a monotonic timestamp, since it's only used to
+        # calculate the elapsed time afterwards.
+        start_time = time.monotonic()
 
         if 'Metadata' in properties:
             metadata = properties['Metadata']
@@ -43,7 +43,7 @@ class SpotifyWebAPI(APIBase):
         self._position = 0
         self._token = token
         self._spotify = Spotify(self._token)
-        self._event_timestamp = time.time()
+        self._event_timestamp = time.monotonic()
 
     def connect_api(self) -> None:
         self._refresh_metadata()
@@ -113,13 +113,13 @@ class SpotifyWebAPI(APIBase):
         # greater than the elapsed time (plus a margin) or if it's negative
         # (backwards).
         playback_diff = self._position - position
-        calls_diff = int((time.time() - self._event_timestamp) * 1000)
+        calls_diff = int((time.monotonic() - self._event_timestamp) * 1000)
         if playback_diff >= (calls_diff + 100) or playback_diff < 0:
             logging.info("Position change detected")
             self.position_signal.emit(self._position)
 
         # The time passed between calls is refreshed
-        self._event_timestamp = time.time()
+        self._event_timestamp = time.monotonic()
 
 
 def get_token(refresh_token: Optional[str], client_id: Optional[str],
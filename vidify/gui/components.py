@@ -288,8 +288,12 @@ class APIConnecter(QLabel):
     status.
     """
 
-    INTERVAL = 1000  # 1 second in ms
-    MAX_ATTEMPTS = 300  # 5 minutes, at 1 connection attempt/second
+    # The first attempts are done quickly so that the user connects in
+    # milliseconds when the API is already available, and the interval
+    # grows exponentially up to INTERVAL to avoid hammering the API.
+    INITIAL_INTERVAL = 100  # The first retry interval, in ms
+    INTERVAL = 1000  # The maximum retry interval: 1 second in ms
+    MAX_ATTEMPTS = 300  # ~5 minutes, at 1 connection attempt/second
     success = Signal(float)
     fail = Signal()
 
@@ -305,24 +309,28 @@ class APIConnecter(QLabel):
 
     def start(self) -> None:
         """
-        Creating the QTimer to check for connection every second, and
-        starting it.
+        Creating the QTimer to check for connection, and starting it. The
+        timer starts with a short interval that's doubled on every failed
+        attempt until it reaches INTERVAL.
         """
 
         self.attempts = self.MAX_ATTEMPTS
+        self.interval = self.INITIAL_INTERVAL
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.try_connection)
-        self.timer.start(self.INTERVAL)
+        self.timer.start(self.interval)
 
     @Slot()
     def try_connection(self) -> None:
         """
-        Function called every second to check if the connection can be
+        Function called periodically to check if the connection can be
         established, so that the program can start.
         """
 
-        # Saving the starting timestamp for the audiosync feature
-        start_time = time.time()
+        # Saving the starting timestamp for the audiosync feature. It's a
+        # monotonic timestamp because it's only used to calculate elapsed
+        # time, and it shouldn't be affected by wall clock changes.
+        start_time = time.monotonic()
 
         # Changing the loading message for the connection one if the first
         # connection attempt was unsuccessful.
@@ -342,6 +350,11 @@ class APIConnecter(QLabel):
             if self.attempts == 0:
                 self.timer.stop()
                 self.fail.emit()
+            elif self.interval < self.INTERVAL:
+                # Applying the exponential backoff until the maximum
+                # interval is reached.
+                self.interval = min(self.INTERVAL, self.interval * 2)
+                self.timer.setInterval(self.interval)
         else:
             self.timer.stop()
             self.success.emit(start_time)
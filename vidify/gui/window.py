@@ -51,27 +51,37 @@ These events are emitted inside the APIs.
 """
 
 import time
-import types
 import logging
-import importlib
 from typing import Callable, Optional
+from functools import partial
 from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
 
 from qtpy.QtWidgets import QWidget, QHBoxLayout
 from qtpy.QtGui import QFontDatabase
-from qtpy.QtCore import Qt, QTimer, QCoreApplication, Slot, QThread
+from qtpy.QtCore import (Qt, QTimer, QCoreApplication, Signal, Slot,
+                         QThread, QThreadPool)
 
 from vidify import format_name, find_module
 from vidify.api import APIS, APIData
 from vidify.player import initialize_player, PlayerData
 from vidify.config import Config
 from vidify.youtube import YouTubeDLWorker, get_direct_url, get_youtube_url
-from vidify.lyrics import get_lyrics
+from vidify.lyrics import LyricsWorker
 from vidify.gui import Res, Colors
 from vidify.gui.components import SetupWidget, APIConnecter
 
 
+def _read_file(path: str) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+
 class MainWindow(QWidget):
+    # Signal used to ask the youtube-dl worker for a new URL, since it
+    # lives in its own thread.
+    _yt_search = Signal(str)
+
     def __init__(self, config: Config) -> None:
         """
         Main window with the GUI and whatever player is being used.
@@ -91,10 +101,14 @@ class MainWindow(QWidget):
             self.setMinimumSize(800, 800)
             self.resize(config.width or 800, config.height or 800)
 
-        # Loading the used fonts (Inter)
+        # Loading the used fonts (Inter). The font files are read in
+        # parallel and registered from memory, which overlaps the disk
+        # reads and skips Qt's own file handling.
         font_db = QFontDatabase()
-        for font in Res.fonts:
-            font_db.addApplicationFont(font)
+        with ThreadPoolExecutor() as executor:
+            font_data = executor.map(_read_file, Res.fonts)
+        for data in font_data:
+            font_db.addApplicationFontFromData(data)
 
         # Initializing the player and saving the config object in the window.
         self.layout = QHBoxLayout(self)
@@ -179,9 +193,7 @@ class MainWindow(QWidget):
             return
 
         # Initializing the API with dependency injection.
-        mod = importlib.import_module(api_data.module)
-        cls = getattr(mod, api_data.class_name)
-        self.api = cls()
+        self.api = api_data.get_class()()
 
         self.wait_for_connection(
             self.api.connect_api, message=api_data.connect_msg,
@@ -262,12 +274,10 @@ class MainWindow(QWidget):
         logging.info("Starting event loop")
         timer = QTimer(self)
 
-        # Qt doesn't accept a method as the parameter so it's converted
-        # to a function.
-        if isinstance(event_loop, types.MethodType):
-            timer.timeout.connect(lambda: event_loop())
-        else:
-            timer.timeout.connect(event_loop)
+        # Qt doesn't accept a method as the parameter, so it's wrapped
+        # with partial, which exposes a plain callable and avoids an extra
+        # Python frame per tick, unlike a lambda.
+        timer.timeout.connect(partial(event_loop))
         timer.start(ms)
 
     @Slot(bool)
@@ -351,20 +361,26 @@ class MainWindow(QWidget):
 
     def launch_youtubedl(self, query: str) -> None:
         """
-        Starts a YoutubeDL thread that will call either
+        Asks the YoutubeDL worker for the video URL, which will call either
         self.on_youtubedl_success or self.on_youtubedl_fail once it's done.
+
+        The worker and its thread are created the first time and reused
+        for the following songs, so that yt-dlp's initialization only
+        happens once.
         """
 
-        logging.info("Starting the youtube-dl thread")
-        self.youtubedl = YouTubeDLWorker(
-            query, self.config.debug, self.config.width, self.config.height)
-        self.yt_thread = QThread()
-        self.youtubedl.moveToThread(self.yt_thread)
-        self.yt_thread.started.connect(self.youtubedl.get_url)
-        self.youtubedl.success.connect(self.on_youtubedl_success)
-        self.youtubedl.fail.connect(self.on_youtubedl_fail)
-        self.youtubedl.finish.connect(self.yt_thread.exit)
-        self.yt_thread.start()
+        if not hasattr(self, 'youtubedl'):
+            logging.info("Starting the youtube-dl thread")
+            self.youtubedl = YouTubeDLWorker(
+                self.config.debug, self.config.width, self.config.height)
+            self.yt_thread = QThread()
+            self.youtubedl.moveToThread(self.yt_thread)
+            self._yt_search.connect(self.youtubedl.get_url)
+            self.youtubedl.success.connect(self.on_youtubedl_success)
+            self.youtubedl.fail.connect(self.on_youtubedl_fail)
+            self.yt_thread.start()
+
+        self._yt_search.emit(query)
 
     @Slot()
     def on_youtubedl_fail(self) -> None:
@@ -399,9 +415,11 @@ class MainWindow(QWidget):
         if not self.config.audiosync:
             self.player.seek(position)
 
-        # Finally, the lyrics are displayed.
+        # Finally, the lyrics are displayed in the background, so that the
+        # request to obtain them doesn't block the GUI.
         if self.config.lyrics:
-            print(get_lyrics(self.api.artist, self.api.title))
+            QThreadPool.globalInstance().start(
+                LyricsWorker(self.api.artist, self.api.title))
 
     @Slot()
     def on_audiosync_fail(self) -> None:
@@ -424,7 +442,9 @@ class MainWindow(QWidget):
         logging.info("Audiosync module returned %d ms", lag)
 
         # The current API position according to what's being recorded.
-        playback_delay = round((time.time() - self.timestamp) * 1000) \
+        # time.monotonic() is used rather than time.time() so that wall
+        # clock jumps don't break the measured delay.
+        playback_delay = round((time.monotonic() - self.timestamp) * 1000) \
             - self.player.position
         lag += playback_delay
 
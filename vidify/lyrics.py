@@ -8,22 +8,30 @@ enough. Lyricwikia is actually a scrapper but its lyrics are available for
 free, in comparison to Genius.
 """
 
+from functools import lru_cache
+
 import lyricwikia
+from qtpy.QtCore import QRunnable
 
 from vidify import format_name, Platform, CURRENT_PLATFORM
 
 
 # The different error messages returned by LyricWikia in order to override
-# them with the default error message.
-ERROR_MESSAGES = (
+# them with the default error message. It's a frozenset for constant-time
+# membership tests.
+ERROR_MESSAGES = frozenset((
     "Unfortunately, we are not licensed to display the full lyrics for this"
     " song at the moment. Hopefully we will be able to in the future. Until"
-    " then... how about a random page?",)
+    " then... how about a random page?",))
 
 
+@lru_cache(maxsize=256)
 def get_lyrics(artist: str, title: str) -> str:
     """
     Using lyricwikia to obtain the song lyrics.
+
+    The results are memoized, since the lyrics of a song never change
+    during a session and they are requested again when it's replayed.
     """
 
     name = format_name(artist, title)
@@ -44,3 +52,18 @@ def get_lyrics(artist: str, title: str) -> str:
             lyrics = "No lyrics found"
 
     return f"{name}\n{lyrics}\n"
+
+
+class LyricsWorker(QRunnable):
+    """
+    Simple runnable to obtain and print the lyrics with QThreadPool, so
+    that the network request doesn't block the GUI thread.
+    """
+
+    def __init__(self, artist: str, title: str) -> None:
+        super().__init__()
+        self._artist = artist
+        self._title = title
+
+    def run(self) -> None:
+        print(get_lyrics(self._artist, self._title))
@@ -3,7 +3,6 @@ This init module lists the available players for the app and how to initialize
 them.
 """
 
-import importlib
 from typing import Tuple
 from dataclasses import dataclass
 
@@ -65,10 +64,9 @@ def initialize_player(player: PlayerData, config: Config) -> PlayerBase:
     instance with the information inside the `player` enumeration object.
     """
 
-    # Importing the module first
-    mod = importlib.import_module(player.module)
-    # Then obtaining the player class
-    cls = getattr(mod, player.class_name)
+    # Obtaining the player class (the import is cached after the first
+    # initialization).
+    cls = player.get_class()
     # No other arguments are needed for now, so all this does is initialize
     # the player with the config flags (if present).
     params = []
@@ -360,8 +360,10 @@ class ExternalPlayer(PlayerBase):
         sent to the clients.
         """
 
+        # The timestamps are monotonic so that the simulated position isn't
+        # affected by wall clock changes.
         self._position = 0
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
         if not is_playing:
             self._pause_time = self._start_time
 
@@ -391,7 +393,7 @@ class ExternalPlayer(PlayerBase):
         pos = self._start_time - self._position
 
         if self._is_playing:
-            return int((time.time() - pos) * 1000)
+            return int((time.monotonic() - pos) * 1000)
         else:
             return int((self._pause_time - pos) * 1000)
 
@@ -431,9 +433,9 @@ class ExternalPlayer(PlayerBase):
         """
 
         if do_pause:
-            self._pause_time = time.time()
+            self._pause_time = time.monotonic()
         else:
-            self._start_time += time.time() - self._pause_time
+            self._start_time += time.monotonic() - self._pause_time
 
         self.send_message(self._clients, self._media, is_playing=not do_pause)
         self._is_playing = not do_pause
@@ -9,6 +9,7 @@ player implementation inherits, and an explanation in detail of the methods.
 
 import locale
 import logging
+import threading
 from typing import Optional
 
 try:
@@ -31,8 +32,9 @@ locale.setlocale(locale.LC_NUMERIC, 'C')
 class MpvPlayer(PlayerBase):
     # The audio is always muted, which is needed because not all the
     # yt-dlp videos are silent. The keep-open flag stops mpv from closing
-    # after the video is over.
-    DEFAULT_FLAGS = ['mute']
+    # after the video is over. These are immutable so that they can simply
+    # be copied and extended when the player is constructed.
+    DEFAULT_FLAGS = ('mute',)
     DEFAULT_ARGS = {
         'vo': 'gpu,libmpv,x11',
         'config': False,
@@ -42,19 +44,36 @@ class MpvPlayer(PlayerBase):
     def __init__(self, flags: Optional[str] = None) -> None:
         super().__init__()
 
-        # Converting the flags passed by parameter (str) to a tuple
-        flags = flags.split() if flags not in (None, '') else []
-        flags.extend(self.DEFAULT_FLAGS)
+        # Converting the flags passed by parameter (str) to a tuple and
+        # appending the defaults.
+        flags = tuple(flags.split()) if flags not in (None, '') else ()
+        flags += self.DEFAULT_FLAGS
 
-        args = {}
+        args = self.DEFAULT_ARGS.copy()
+        args['wid'] = str(int(self.winId()))  # sip.voidptr -> int -> str
         if logging.root.level <= logging.INFO:
             args['log_handler'] = print
             args['loglevel'] = 'info'
-        args['wid'] = str(int(self.winId()))  # sip.voidptr -> int -> str
-        args.update(self.DEFAULT_ARGS)
 
         self._mpv = MPV(*flags, **args)
 
+        # The 'seekable' property is tracked with an observer so that
+        # seek() doesn't have to ask libmpv for it every time: once a video
+        # has loaded, waiting is just a check on an event flag.
+        self._seekable = threading.Event()
+        self._mpv.observe_property('seekable', self._on_seekable)
+
+    def _on_seekable(self, name: str, value: Optional[bool]) -> None:
+        """
+        Called by libmpv whenever the seekable property changes. It's False
+        while a new video is loading.
+        """
+
+        if value:
+            self._seekable.set()
+        else:
+            self._seekable.clear()
+
     @property
     def pause(self) -> bool:
         return self._mpv.pause
@@ -75,7 +94,7 @@ class MpvPlayer(PlayerBase):
         starts, so this waits for 'seekable' to be set to True.
         """
 
-        self._mpv.wait_for_property('seekable')
+        self._seekable.wait()
         logging.info("Position set to %d milliseconds", ms)
         self._mpv.seek(round(ms / 1000, 2),
                        reference='relative' if relative else 'absolute')
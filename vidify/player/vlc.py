@@ -48,19 +48,41 @@ class VLCPlayer(PlayerBase):
 
         self._player = self._vlc.media_player_new()
 
+        # Calling winId() promotes the widget to a native window, which is
+        # relatively expensive and has visual side effects, so it's done
+        # exactly once here and cached for every new video.
+        self._wid = int(self.winId())  # sip.voidptr -> int
+
+        # The platform never changes at runtime, so the libvlc call that
+        # embeds the video into this widget can be resolved here once
+        # instead of branching on every new video.
+        self._bind_window = {
+            Platform.LINUX: self._player.set_xwindow,
+            Platform.BSD: self._player.set_xwindow,
+            Platform.WINDOWS: self._player.set_hwnd,
+            Platform.MACOS: self._player.set_nsobject
+        }.get(CURRENT_PLATFORM)
+
+        # The last known playback status. Every status change goes through
+        # this class, so the getter can be answered from here instead of
+        # crossing the libvlc FFI boundary with is_playing().
+        self._paused = True
+
     @property
     def pause(self) -> bool:
-        return not self._player.is_playing()
+        return self._paused
 
     @pause.setter
     def pause(self, do_pause: bool) -> None:
-        # Saved in variable to not call self._player.is_playing() twice
-        is_paused = self.pause
+        if do_pause == self._paused:
+            return
+
         logging.info("Playing/Pausing video")
-        if do_pause and not is_paused:
+        if do_pause:
             self._player.pause()
-        elif not do_pause and is_paused:
+        else:
             self._player.play()
+        self._paused = do_pause
 
     @property
     def position(self) -> int:
@@ -74,16 +96,13 @@ class VLCPlayer(PlayerBase):
 
     def start_video(self, media: str, is_playing: bool = True) -> None:
         logging.info("Starting new video")
-        if CURRENT_PLATFORM in (Platform.LINUX, Platform.BSD):
-            self._player.set_xwindow(int(self.winId()))
-        elif CURRENT_PLATFORM == Platform.WINDOWS:
-            self._player.set_hwnd(int(self.winId()))
-        elif CURRENT_PLATFORM == Platform.MACOS:
-            self._player.set_nsobject(int(self.winId()))
+        if self._bind_window is not None:
+            self._bind_window(self._wid)
 
         self._media = self._vlc.media_new(media)
         self._media.get_mrl()
         self._player.set_media(self._media)
         # VLC starts paused
+        self._paused = True
         if is_playing:
             self.pause = False
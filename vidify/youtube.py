@@ -2,13 +2,86 @@
 This module uses yt-dlp to obtain the actual URL of a YouTube link.
 That way, the video can be played directly with a video player like VLC
 or mpv.
+
+The results are also saved in a persistent cache, so that replaying a song
+doesn't require a new search on YouTube, which usually takes a few seconds.
 """
 
+import os
+import time
 import logging
+import sqlite3
 from typing import Optional
 
 from yt_dlp import YoutubeDL
-from qtpy.QtCore import QObject, Signal
+from qtpy.QtCore import QObject, Signal, Slot
+
+from vidify.config import APP_DIRS
+
+
+# Where the YouTube URL cache is saved in the user's system.
+CACHE_PATH = os.path.join(APP_DIRS.user_cache_dir, "youtube.db")
+# The direct URLs returned by YouTube are signed and they expire after a
+# few hours, so the cached entries can only be reused for a limited time.
+CACHE_TTL_SECONDS = 4 * 60 * 60
+
+
+def _cache_connect() -> sqlite3.Connection:
+    """
+    Opens a connection to the cache database, creating it the first time
+    it's used.
+    """
+
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    conn = sqlite3.connect(CACHE_PATH)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS urls (
+            query TEXT PRIMARY KEY,
+            url TEXT,
+            webpage_url TEXT,
+            expires REAL
+        )""")
+    return conn
+
+
+def cache_load(query: str) -> Optional[dict]:
+    """
+    Returns the saved data for a query, or None if it's not cached or if it
+    already expired. The returned dictionary follows the same structure as
+    the one obtained with yt-dlp, so that they can be used equally.
+    """
+
+    try:
+        with _cache_connect() as conn:
+            row = conn.execute(
+                "SELECT url, webpage_url FROM urls WHERE query = ?"
+                " AND expires > ?", (query, time.time())).fetchone()
+    except (OSError, sqlite3.Error) as e:
+        logging.info("Couldn't read the URL cache: %s", str(e))
+        return None
+
+    if row is None:
+        return None
+
+    logging.info("Using cached URL for %s", query)
+    return {'entries': [{'url': row[0], 'webpage_url': row[1]}]}
+
+
+def cache_save(query: str, data: dict) -> None:
+    """
+    Saves the relevant fields of a yt-dlp result in the cache.
+    """
+
+    entry = data['entries'][0]
+    try:
+        with _cache_connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO urls VALUES (?, ?, ?, ?)",
+                (query, entry['url'], entry['webpage_url'],
+                 time.time() + CACHE_TTL_SECONDS))
+    except (OSError, sqlite3.Error) as e:
+        logging.info("Couldn't save %s in the URL cache: %s", query, str(e))
 
 
 def get_direct_url(data: dict) -> str:
@@ -44,14 +117,10 @@ class YouTubeDLWorker(QObject):
     fail = Signal()
     finish = Signal()
 
-    def __init__(self, query: str, debug: bool = False,
-                 width: Optional[int] = None, height: Optional[int] = None
-                 ) -> None:
+    def __init__(self, debug: bool = False, width: Optional[int] = None,
+                 height: Optional[int] = None) -> None:
         super().__init__()
 
-        # The query attribute contains the full search to be done on YouTube.
-        self.query = query
-
         self.options = {
             'format': 'bestvideo',
             'quiet': not debug
@@ -61,28 +130,47 @@ class YouTubeDLWorker(QObject):
         if height is not None:
             self.options['format'] += f'[height<={height}]'
 
-    def get_url(self) -> None:
+        # The YoutubeDL instance is created lazily the first time it's
+        # needed (inside the worker thread), and then reused for the rest
+        # of the session, since setting up its extractors is a relatively
+        # expensive fixed cost.
+        self._ytdl = None
+
+    @Slot(str)
+    def get_url(self, query: str) -> None:
         """
         Getting the youtube direct link with yt-dlp, intended to be used
         with a QThread. It's guaranteed that either a success signal or a
         fail signal will be emitted.
+
+        The cache is tried first, so that replayed songs don't need a new
+        search on YouTube.
         """
 
-        with YoutubeDL(self.options) as ytdl:
-            try:
-                data = ytdl.extract_info(self.query, download=False)
-            except Exception as e:
-                # Any kind of error has to be caught, so that it doesn't only
-                # send the error signal when the download wasn't successful
-                # (a DownloadError from yt_dlp).
-                logging.info("yt-dlp wasn't able to obtain the video: %s",
-                             str(e))
+        data = cache_load(query)
+        if data is not None:
+            self.success.emit(data)
+            self.finish.emit()
+            return
+
+        if self._ytdl is None:
+            self._ytdl = YoutubeDL(self.options)
+
+        try:
+            data = self._ytdl.extract_info(query, download=False)
+        except Exception as e:
+            # Any kind of error has to be caught, so that it doesn't only
+            # send the error signal when the download wasn't successful
+            # (a DownloadError from yt_dlp).
+            logging.info("yt-dlp wasn't able to obtain the video: %s",
+                         str(e))
+            self.fail.emit()
+        else:
+            if len(data['entries']) == 0:
+                logging.info("yt-dlp returned no entries")
                 self.fail.emit()
             else:
-                if len(data['entries']) == 0:
-                    logging.info("yt-dlp returned no entries")
-                    self.fail.emit()
-                else:
-                    self.success.emit(data)
-            finally:
-                self.finish.emit()
+                cache_save(query, data)
+                self.success.emit(data)
+        finally:
+            self.finish.emit()